@@ -210,8 +210,8 @@ cdef class RoughConductor(ContinuousBSDF):
             s_incoming.z + s_outgoing.z
         )
 
-        # catch ill defined half vector
-        if s_half.get_length() == 0.0:
+        # catch ill defined half vector (squared length avoids a square root)
+        if s_half.dot(s_half) == 0.0:
             # should never produce a none zero BSDF value therefore safe to return zero as pdf
             return 0.0
 
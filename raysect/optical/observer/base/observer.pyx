@@ -33,6 +33,7 @@ from time import time
 from raysect.core.workflow import RenderEngine, MulticoreEngine
 
 cimport cython
+from raysect.core cimport AffineMatrix3D
 from raysect.optical cimport World, Spectrum
 from raysect.optical.observer.base.sampler cimport FrameSampler1D, FrameSampler2D
 from raysect.optical.observer.base.pipeline cimport Pipeline0D, Pipeline1D, Pipeline2D
@@ -382,10 +383,14 @@ cdef class _ObserverBase(Observer):
             Ray ray
             Spectrum spectrum
             list results
+            AffineMatrix3D to_world
 
         # obtain reference to world
         world = self.root
 
+        # the observer's position in the scenegraph is fixed for the duration of the render
+        to_world = self.to_root()
+
         # generate rays and obtain pixel processors from each pipeline
         rays = self._obtain_rays(task, template)
         pixel_processors = self._obtain_pixel_processors(task, slice_id)
@@ -400,8 +405,8 @@ cdef class _ObserverBase(Observer):
         for ray, projection_weight in rays:
 
             # convert ray from local space to world space
-            ray.origin = ray.origin.transform(self.to_root())
-            ray.direction = ray.direction.transform(self.to_root())
+            ray.origin = ray.origin.transform(to_world)
+            ray.direction = ray.direction.transform(to_world)
 
             # sample, apply projection weight
             spectrum = ray.trace(world)
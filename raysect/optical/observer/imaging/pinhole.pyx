@@ -31,9 +31,11 @@ from raysect.optical.observer.sampler2d import FullFrameSampler2D
 from raysect.optical.observer.pipeline import RGBPipeline2D
 from raysect.optical.observer.sampler2d import RGBAdaptiveSampler2D
 
-from raysect.core cimport Point3D, new_point3d, Vector3D, new_vector3d, RectangleSampler3D
+cimport cython
+from raysect.core cimport Point3D, new_point3d, Vector3D, new_vector3d
+from raysect.core.math.random cimport uniform
 from raysect.optical cimport Ray
-from libc.math cimport M_PI as pi, tan
+from libc.math cimport M_PI as pi, tan, sqrt
 from raysect.optical.observer.base cimport Observer2D
 
 
@@ -71,7 +73,6 @@ cdef class PinholeCamera(Observer2D):
 
     cdef:
         double _sensitivity, _fov, image_delta, image_start_x, image_start_y
-        RectangleSampler3D point_sampler
 
     def __init__(self, pixels, fov=None, sensitivity=None, frame_sampler=None, pipelines=None, parent=None, transform=None, name=None):
 
@@ -138,39 +139,46 @@ cdef class PinholeCamera(Observer2D):
             self.image_start_x = 0.5 * self.pixels[0] * image_delta
             self.image_start_y = 0.5 * self.pixels[1] * image_delta
 
-            # rebuild point generator
-            self.point_sampler = RectangleSampler3D(self.image_delta, self.image_delta)
-
         else:
             raise RuntimeError("Number of Pinhole camera Pixels must be > 1.")
 
+    @cython.cdivision(True)
     cpdef list _generate_rays(self, int x, int y, Ray template, int ray_count):
 
         cdef:
-            double pixel_x, pixel_y
-            list points, rays
-            Point3D pixel_centre, point, origin
+            int i
+            double pixel_x, pixel_y, pixel_offset, sample_x, sample_y, recip_length
+            list rays
+            Point3D origin
             Vector3D direction
             Ray ray
 
         # generate pixel transform
         pixel_x = self.image_start_x - self.image_delta * x
         pixel_y = self.image_start_y - self.image_delta * y
-        pixel_centre = new_point3d(pixel_x, pixel_y, 1)
+        pixel_offset = 0.5 * self.image_delta
 
-        points = self.point_sampler.samples(ray_count)
+        # all rays are launched from the pinhole, the origin point is never
+        # modified in place so a single instance can be shared by every ray
+        origin = new_point3d(0, 0, 0)
 
         # assemble rays
         rays = []
-        for point in points:
-
-            # calculate point in virtual image plane to be used for ray direction
-            origin = new_point3d(0, 0, 0)
-            direction = new_vector3d(
-                point.x + pixel_centre.x,
-                point.y + pixel_centre.y,
-                point.z + pixel_centre.z
-            ).normalise()
+        for i in range(ray_count):
+
+            # sample a point in the pixel area on the virtual image plane, the
+            # coordinates are generated directly rather than via a surface
+            # sampler to avoid allocating an intermediate Point3D per ray
+            sample_x = uniform() * self.image_delta - pixel_offset
+            sample_y = uniform() * self.image_delta - pixel_offset
+
+            # calculate point in virtual image plane to be used for ray direction,
+            # normalised inline to avoid allocating an intermediate Vector3D
+            # (the z component is always 1 so the length can not be zero)
+            sample_x += pixel_x
+            sample_y += pixel_y
+            recip_length = 1.0 / sqrt(sample_x * sample_x + sample_y * sample_y + 1.0)
+            direction = new_vector3d(sample_x * recip_length, sample_y * recip_length, recip_length)
 
             ray = template.copy(origin, direction)
 
@@ -235,9 +235,16 @@ cdef class PowerPipeline1D(Pipeline1D):
         if not self.accumulate or self.frame is None or self.frame.length != pixels:
             self.frame = StatsArray1D(pixels)
 
-        self._working_mean = np.zeros(pixels)
-        self._working_variance = np.zeros(pixels)
-        self._working_touched = np.zeros(pixels, dtype=np.int8)
+        # reuse the working buffers if the frame geometry is unchanged, this
+        # avoids reallocating potentially large arrays on every call to observe()
+        if self._working_mean is None or self._working_mean.shape[0] != pixels:
+            self._working_mean = np.zeros(pixels)
+            self._working_variance = np.zeros(pixels)
+            self._working_touched = np.zeros(pixels, dtype=np.int8)
+        else:
+            self._working_mean[:] = 0
+            self._working_variance[:] = 0
+            self._working_touched[:] = 0
 
         # generate pixel processor configurations for each spectral slice
         self._resampled_filter = [self.filter.sample_mv(slice.min_wavelength, slice.max_wavelength, slice.bins) for slice in spectral_slices]
@@ -493,9 +500,16 @@ cdef class PowerPipeline2D(Pipeline2D):
         if not self.accumulate or self.frame is None or self.frame.shape != (nx, ny):
             self.frame = StatsArray2D(nx, ny)
 
-        self._working_mean = np.zeros((nx, ny))
-        self._working_variance = np.zeros((nx, ny))
-        self._working_touched = np.zeros((nx, ny), dtype=np.int8)
+        # reuse the working buffers if the frame geometry is unchanged, this
+        # avoids reallocating potentially large arrays on every call to observe()
+        if self._working_mean is None or self._working_mean.shape[0] != nx or self._working_mean.shape[1] != ny:
+            self._working_mean = np.zeros((nx, ny))
+            self._working_variance = np.zeros((nx, ny))
+            self._working_touched = np.zeros((nx, ny), dtype=np.int8)
+        else:
+            self._working_mean[:, :] = 0
+            self._working_variance[:, :] = 0
+            self._working_touched[:, :] = 0
 
         # generate pixel processor configurations for each spectral slice
         self._resampled_filter = [self.filter.sample_mv(slice.min_wavelength, slice.max_wavelength, slice.bins) for slice in spectral_slices]
@@ -28,7 +28,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 cimport numpy as np
-from raysect.optical.observer.base cimport PixelProcessor, Pipeline2D
+from raysect.optical.observer.base cimport PixelProcessor, Pipeline2D, SpectralSlice
 from raysect.core.math cimport StatsArray3D, StatsArray1D
 
 
@@ -45,6 +45,7 @@ cdef class RGBPipeline2D(Pipeline2D):
         char[:,::1] _working_touched
         StatsArray3D _display_frame
         list _processors
+        dict _resample_cache
         tuple _pixels
         int _samples
         object _display_figure
@@ -53,10 +54,14 @@ cdef class RGBPipeline2D(Pipeline2D):
         public bint display_persist_figure
         bint _quiet
 
+    cdef double[:,::1] _resample_xyz(self, SpectralSlice slice)
+
     cpdef object _start_display(self)
 
     cpdef object _update_display(self, int x, int y)
 
+    cpdef object _update_display_frame(self)
+
     cpdef object _refresh_display(self)
 
     cpdef object _render_display(self, StatsArray3D frame, str status=*)
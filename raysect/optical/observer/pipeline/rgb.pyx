@@ -33,7 +33,7 @@ import numpy as np
 
 cimport cython
 cimport numpy as np
-from raysect.optical.observer.base cimport PixelProcessor, Pipeline2D
+from raysect.optical.observer.base cimport PixelProcessor, Pipeline2D, SpectralSlice
 from raysect.core.math cimport StatsArray3D, StatsArray1D
 from raysect.optical.colour cimport resample_ciexyz, spectrum_to_ciexyz, ciexyz_to_srgb
 
@@ -102,6 +102,7 @@ cdef class RGBPipeline2D(Pipeline2D):
         self._display_figure = None
 
         self._processors = None
+        self._resample_cache = {}
 
         self._pixels = None
         self._samples = 0
@@ -142,6 +143,7 @@ cdef class RGBPipeline2D(Pipeline2D):
         self._display_frame = None
         self._display_timer = 0
         self._display_figure = None
+        self._resample_cache = {}
         self._pixels = None
         self._samples = 0
         self._quiet = False
@@ -223,19 +225,36 @@ cdef class RGBPipeline2D(Pipeline2D):
         if not self.accumulate or self.xyz_frame is None or self.xyz_frame.shape != (nx, ny, 3):
             self.xyz_frame = StatsArray3D(nx, ny, 3)
 
-        self._working_mean = np.zeros((nx, ny, 3))
-        self._working_variance = np.zeros((nx, ny, 3))
-        self._working_touched = np.zeros((nx, ny), dtype=np.int8)
+        # reuse the working buffers if the frame geometry is unchanged, this
+        # avoids reallocating potentially large arrays on every call to observe()
+        if self._working_mean is None or self._working_mean.shape[0] != nx or self._working_mean.shape[1] != ny:
+            self._working_mean = np.zeros((nx, ny, 3))
+            self._working_variance = np.zeros((nx, ny, 3))
+            self._working_touched = np.zeros((nx, ny), dtype=np.int8)
+        else:
+            self._working_mean[:, :, :] = 0
+            self._working_variance[:, :, :] = 0
+            self._working_touched[:, :] = 0
 
         # generate pixel processor configurations for each spectral slice
-        resampled_xyz = [resample_ciexyz(slice.min_wavelength, slice.max_wavelength, slice.bins) for slice in spectral_slices]
-        self._processors = [XYZPixelProcessor(xyz) for xyz in resampled_xyz]
+        self._processors = [XYZPixelProcessor(self._resample_xyz(slice)) for slice in spectral_slices]
 
         self._quiet = quiet
 
         if self.display_progress:
             self._start_display()
 
+    cdef double[:,::1] _resample_xyz(self, SpectralSlice slice):
+
+        # the resampled CIE XYZ curves only depend on the slice wavelength range
+        # and bin count, cache them to avoid resampling on every call to observe()
+        key = (slice.min_wavelength, slice.max_wavelength, slice.bins)
+        resampled_xyz = self._resample_cache.get(key)
+        if resampled_xyz is None:
+            resampled_xyz = resample_ciexyz(slice.min_wavelength, slice.max_wavelength, slice.bins)
+            self._resample_cache[key] = resampled_xyz
+        return resampled_xyz
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cpdef PixelProcessor pixel_processor(self, int x, int y, int slice_id):
@@ -311,29 +330,19 @@ cdef class RGBPipeline2D(Pipeline2D):
 
         self._display_timer = time()
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
-    @cython.initializedcheck(False)
     cpdef object _update_display(self, int x, int y):
         """
         Update live render.
         """
 
-        # update display pixel by combining existing frame data with working data
-        self._display_frame.mean_mv[x, y, :] = self.xyz_frame.mean_mv[x, y, :]
-        self._display_frame.variance_mv[x, y, :] = self.xyz_frame.variance_mv[x, y, :]
-        self._display_frame.samples_mv[x, y, :] = self.xyz_frame.samples_mv[x, y, :]
-
-        self._display_frame.combine_samples(x, y, 0, self._working_mean[x, y, 0], self._working_variance[x, y, 0], self._samples)
-        self._display_frame.combine_samples(x, y, 1, self._working_mean[x, y, 1], self._working_variance[x, y, 1], self._samples)
-        self._display_frame.combine_samples(x, y, 2, self._working_mean[x, y, 2], self._working_variance[x, y, 2], self._samples)
-
-        # update live render display
+        # update live render display, the display frame is only assembled from
+        # the working data when a refresh is due rather than after every update
         if (time() - self._display_timer) > self.display_update_time:
 
             if not self._quiet:
                 print("{} - updating display...".format(self.name))
 
+            self._update_display_frame()
             self._render_display(self._display_frame, 'rendering...')
 
             # workaround for interactivity for QT backend
@@ -344,6 +353,25 @@ cdef class RGBPipeline2D(Pipeline2D):
 
             self._display_timer = time()
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.initializedcheck(False)
+    cpdef object _update_display_frame(self):
+        """
+        Update the live frame by combining existing frame data with working data.
+        """
+
+        cdef int x, y, c
+
+        for x in range(self._display_frame.nx):
+            for y in range(self._display_frame.ny):
+                if self._working_touched[x, y] == 1:
+                    for c in range(3):
+                        self._display_frame.mean_mv[x, y, c] = self.xyz_frame.mean_mv[x, y, c]
+                        self._display_frame.variance_mv[x, y, c] = self.xyz_frame.variance_mv[x, y, c]
+                        self._display_frame.samples_mv[x, y, c] = self.xyz_frame.samples_mv[x, y, c]
+                        self._display_frame.combine_samples(x, y, c, self._working_mean[x, y, c], self._working_variance[x, y, c], self._samples)
+
     cpdef object _refresh_display(self):
         """
         Refreshes the display window (if active) and frame data is present.
@@ -402,25 +430,17 @@ cdef class RGBPipeline2D(Pipeline2D):
     cpdef np.ndarray _generate_display_image(self, StatsArray3D frame):
 
         cdef:
-            int x, y, c
             np.ndarray xyz_image, rgb_image
-            double[:,:,::1] xyz_image_mv
-            double gamma_exponent
 
         if self._display_auto_exposure:
             self._display_sensitivity = self._calculate_sensitivity(frame.mean)
 
-        xyz_image = frame.mean.copy()
-        xyz_image_mv = xyz_image
-
-        # apply sensitivity
-        for x in range(frame.nx):
-            for y in range(frame.ny):
-                for c in range(frame.nz):
-                    xyz_image_mv[x, y, c] *= self._display_sensitivity
+        # apply sensitivity, a single array operation over the whole frame
+        # replaces the copy followed by a per-element scaling pass
+        xyz_image = frame.mean * self._display_sensitivity
 
         # convert XYZ to sRGB
-        rgb_image = self._generate_srgb_image(xyz_image_mv)
+        rgb_image = self._generate_srgb_image(xyz_image)
 
         return rgb_image
 
@@ -480,12 +500,15 @@ cdef class RGBPipeline2D(Pipeline2D):
         cdef:
             int nx, ny, ix, iy
             np.ndarray rgb_image
-            double[:,:,::1] rgb_image_mv
+            float[:,:,::1] rgb_image_mv
             (double, double, double) rgb_pixel
 
         nx = xyz_image_mv.shape[0]
         ny = xyz_image_mv.shape[1]
-        rgb_image = np.zeros((nx, ny, 3))
+
+        # single precision is ample for display values in the range [0, 1] and
+        # halves the memory traffic when the image is handed to matplotlib
+        rgb_image = np.zeros((nx, ny, 3), dtype=np.float32)
         rgb_image_mv = rgb_image
 
         # convert to sRGB colour space
@@ -29,7 +29,7 @@
 
 cimport numpy as np
 
-from raysect.optical.observer.base cimport PixelProcessor, Pipeline0D, Pipeline1D, Pipeline2D
+from raysect.optical.observer.base cimport PixelProcessor, Pipeline0D, Pipeline1D, Pipeline2D, SpectralSlice
 from raysect.core.math cimport StatsArray1D, StatsArray2D, StatsArray3D
 
 
@@ -71,11 +71,16 @@ cdef class SpectralPowerPipeline2D(Pipeline2D):
         tuple _pixels
         int _samples
         list _spectral_slices
+        list _processors
         readonly int bins
         readonly double min_wavelength, max_wavelength, delta_wavelength
         readonly np.ndarray wavelengths
 
+    cdef PixelProcessor _new_processor(self, SpectralSlice slice)
+
 
 cdef class SpectralPowerPixelProcessor(PixelProcessor):
 
     cdef StatsArray1D bins
+
+    cpdef object reset(self)
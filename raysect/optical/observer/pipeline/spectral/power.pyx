@@ -118,7 +118,7 @@ cdef class SpectralPowerPipeline0D(Pipeline0D):
         self.max_wavelength = max_wavelength
         self.delta_wavelength = (max_wavelength - min_wavelength) / spectral_bins
         self.bins = spectral_bins
-        self.wavelengths = np.array([min_wavelength + (0.5 + i) * self.delta_wavelength for i in range(spectral_bins)])
+        self.wavelengths = min_wavelength + (0.5 + np.arange(spectral_bins)) * self.delta_wavelength
 
         # create samples buffer
         if not self.accumulate or self.samples is None or self.samples.length != spectral_bins:
@@ -273,7 +273,7 @@ cdef class SpectralPowerPipeline1D(Pipeline1D):
         self.max_wavelength = max_wavelength
         self.delta_wavelength = (max_wavelength - min_wavelength) / spectral_bins
         self.bins = spectral_bins
-        self.wavelengths = np.array([min_wavelength + (0.5 + i) * self.delta_wavelength for i in range(spectral_bins)])
+        self.wavelengths = min_wavelength + (0.5 + np.arange(spectral_bins)) * self.delta_wavelength
 
         # create frame-buffer
         if not self.accumulate or self.frame is None or self.frame.shape != (pixels, spectral_bins):
@@ -353,6 +353,7 @@ cdef class SpectralPowerPipeline2D(Pipeline2D):
         self._pixels = None
         self._samples = 0
         self._spectral_slices = None
+        self._processors = None
 
         self.min_wavelength = 0
         self.max_wavelength = 0
@@ -390,6 +391,7 @@ cdef class SpectralPowerPipeline2D(Pipeline2D):
         self._pixels = 0
         self._samples = 0
         self._spectral_slices = None
+        self._processors = None
 
     # must override automatic __reduce__ method generated by cython for the base class
     def __reduce__(self):
@@ -406,16 +408,25 @@ cdef class SpectralPowerPipeline2D(Pipeline2D):
         self.max_wavelength = max_wavelength
         self.delta_wavelength = (max_wavelength - min_wavelength) / spectral_bins
         self.bins = spectral_bins
-        self.wavelengths = np.array([min_wavelength + (0.5 + i) * self.delta_wavelength for i in range(spectral_bins)])
+        self.wavelengths = min_wavelength + (0.5 + np.arange(spectral_bins)) * self.delta_wavelength
 
         # create frame-buffer
         if not self.accumulate or self.frame is None or self.frame.shape != (nx, ny, spectral_bins):
             self.frame = StatsArray3D(nx, ny, spectral_bins)
 
+        # one processor object per spectral slice is shared by every pixel, it is
+        # reset before use (which replaces its sample buffers)
+        self._processors = [self._new_processor(slice) for slice in spectral_slices]
+
+    cdef PixelProcessor _new_processor(self, SpectralSlice slice):
+        return SpectralPowerPixelProcessor(slice)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cpdef PixelProcessor pixel_processor(self, int x, int y, int slice_id):
-        return SpectralPowerPixelProcessor(self._spectral_slices[slice_id])
+        cdef SpectralPowerPixelProcessor processor = self._processors[slice_id]
+        processor.reset()
+        return processor
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -472,6 +483,9 @@ cdef class SpectralPowerPixelProcessor(PixelProcessor):
     def __init__(self, SpectralSlice slice):
         self.bins = StatsArray1D(slice.bins)
 
+    cpdef object reset(self):
+        self.bins.clear()
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
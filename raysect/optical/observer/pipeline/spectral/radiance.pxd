@@ -31,6 +31,7 @@ from raysect.optical cimport Spectrum
 from raysect.optical.observer.pipeline.spectral.power cimport SpectralPowerPipeline0D, SpectralPowerPipeline1D, SpectralPowerPipeline2D
 from raysect.core.math cimport StatsArray1D
 from raysect.optical.observer.base.processor cimport PixelProcessor
+from raysect.optical.observer.base.slice cimport SpectralSlice
 
 
 cdef class SpectralRadiancePipeline0D(SpectralPowerPipeline0D):
@@ -45,9 +46,13 @@ cdef class SpectralRadiancePipeline1D(SpectralPowerPipeline1D):
 
 cdef class SpectralRadiancePipeline2D(SpectralPowerPipeline2D):
 
+    cdef PixelProcessor _new_processor(self, SpectralSlice slice)
+
     cpdef Spectrum to_spectrum(self, int x, int y)
 
 
 cdef class SpectralRadiancePixelProcessor(PixelProcessor):
 
     cdef StatsArray1D bins
+
+    cpdef object reset(self)
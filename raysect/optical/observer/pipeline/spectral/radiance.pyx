@@ -196,10 +196,15 @@ cdef class SpectralRadiancePipeline2D(SpectralPowerPipeline2D):
         name = name or _DEFAULT_PIPELINE_NAME
         super().__init__(accumulate=accumulate, name=name)
 
+    cdef PixelProcessor _new_processor(self, SpectralSlice slice):
+        return SpectralRadiancePixelProcessor(slice)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cpdef PixelProcessor pixel_processor(self, int x, int y, int slice_id):
-        return SpectralRadiancePixelProcessor(self._spectral_slices[slice_id])
+        cdef SpectralRadiancePixelProcessor processor = self._processors[slice_id]
+        processor.reset()
+        return processor
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -249,6 +254,9 @@ cdef class SpectralRadiancePixelProcessor(PixelProcessor):
     def __init__(self, SpectralSlice slice):
         self.bins = StatsArray1D(slice.bins)
 
+    cpdef object reset(self):
+        self.bins.clear()
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
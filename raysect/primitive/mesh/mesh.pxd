@@ -60,11 +60,9 @@ cdef class MeshData(KDTree3DCore):
 
     cpdef Normal3D face_normal(self, int index)
 
-    cdef object _filter_triangles(self)
-
     cdef object _flip_normals(self)
 
-    cdef object _generate_face_normals(self)
+    cdef object _generate_face_normals(self, bint tolerant)
 
     cdef BoundingBox3D _generate_bounding_box(self, int32_t i)
 
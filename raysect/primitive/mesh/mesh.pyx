@@ -35,7 +35,7 @@ import struct
 from numpy import array, float32, int32, zeros
 from raysect.core cimport Primitive, AffineMatrix3D, Normal3D, new_normal3d, Point3D, new_point3d, Vector3D, new_vector3d, Material, Ray, new_ray, Intersection, new_intersection, BoundingBox3D, new_boundingbox3d
 from raysect.core.math.spatial cimport KDTree3DCore, Item3D
-from libc.math cimport fabs
+from libc.math cimport fabs, sqrt
 from numpy cimport float32_t, int32_t, uint8_t
 from cpython.bytes cimport PyBytes_AsString
 cimport cython
@@ -77,7 +77,6 @@ DEF NO_INTERSECTION = -1
 DEF RSM_VERSION_MAJOR = 1
 DEF RSM_VERSION_MINOR = 0
 
-# TODO: fire exceptions if degenerate triangles are found and tolerant mode is not enabled (the face normal call will fail @ normalisation)
 # TODO: tidy up the internal storage of triangles - separate the triangle reference arrays for vertices, normals etc...
 # TODO: the following code really is a bit opaque, needs a general tidy up
 # TODO: move load/save code to C?
@@ -172,16 +171,12 @@ cdef class MeshData(KDTree3DCore):
         self._t = INFINITY
         self._i = NO_INTERSECTION
 
-        # filter out degenerate triangles if we are being tolerant
-        if tolerant:
-            self._filter_triangles()
-
         # flip normals if requested
         if flip_normals:
             self._flip_normals()
 
-        # generate face normals
-        self._generate_face_normals()
+        # generate face normals, filtering out degenerate triangles if we are being tolerant
+        self._generate_face_normals(tolerant)
 
         # kd-Tree init requires the triangle's id (it's index here) and bounding box
         items = []
@@ -299,47 +294,6 @@ cdef class MeshData(KDTree3DCore):
             self.face_normals_mv[index, Z]
         )
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
-    @cython.initializedcheck(False)
-    cdef object _filter_triangles(self):
-
-        cdef:
-            int32_t i, valid
-            int32_t i1, i2, i3
-            Point3D p1, p2, p3
-            Vector3D v1, v2, v3
-
-        # scan triangles and make valid triangles contiguous
-        valid = 0
-        for i in range(self.triangles_mv.shape[0]):
-
-            i1 = self.triangles_mv[i, V1]
-            i2 = self.triangles_mv[i, V2]
-            i3 = self.triangles_mv[i, V3]
-
-            p1 = new_point3d(self.vertices_mv[i1, X], self.vertices_mv[i1, Y], self.vertices_mv[i1, Z])
-            p2 = new_point3d(self.vertices_mv[i2, X], self.vertices_mv[i2, Y], self.vertices_mv[i2, Z])
-            p3 = new_point3d(self.vertices_mv[i3, X], self.vertices_mv[i3, Y], self.vertices_mv[i3, Z])
-
-            # the cross product of two edge vectors of a degenerate triangle
-            # (where 2 or more vertices are coincident or lie on the same line)
-            # is zero
-            v1 = p1.vector_to(p2)
-            v2 = p1.vector_to(p3)
-            v3 = v1.cross(v2)
-            if v3.get_length() == 0.0:
-
-                # triangle is degenerate, skip
-                continue
-
-            # shift triangles
-            self.triangles_mv[valid, :] = self.triangles_mv[i, :]
-            valid += 1
-
-        # reslice array to contain only valid triangles
-        self.triangles_mv = self.triangles_mv[:valid, :]
-
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
@@ -367,7 +321,8 @@ cdef class MeshData(KDTree3DCore):
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
-    cdef object _generate_face_normals(self):
+    @cython.cdivision(True)
+    cdef object _generate_face_normals(self, bint tolerant):
         """
         Calculate the triangles face normals from the vertices.
 
@@ -375,33 +330,80 @@ cdef class MeshData(KDTree3DCore):
         rule. When looking at the triangle from the back face, the vertices
         will be ordered in a clockwise fashion and the normal will be pointing
         away from the observer.
+
+        Degenerate triangles (where 2 or more vertices are coincident or lie on
+        the same line) have no defined normal. If tolerant is True they are
+        removed from the triangle array in the same pass, otherwise an
+        exception is raised.
+
+        :param tolerant: Toggles filtering out of degenerate triangles.
         """
 
         cdef:
-            int32_t i
+            int32_t i, valid
             int32_t i1, i2, i3
-            Point3D p1, p2, p3
-            Vector3D v1, v2, v3
+            double e1x, e1y, e1z
+            double e2x, e2y, e2z
+            double nx, ny, nz, t
 
         self._face_normals = zeros((self.triangles_mv.shape[0], 3), dtype=float32)
         self.face_normals_mv = self._face_normals
-        for i in range(self.face_normals_mv.shape[0]):
+
+        # scan triangles and make valid triangles contiguous
+        valid = 0
+        for i in range(self.triangles_mv.shape[0]):
 
             i1 = self.triangles_mv[i, V1]
             i2 = self.triangles_mv[i, V2]
             i3 = self.triangles_mv[i, V3]
 
-            p1 = new_point3d(self.vertices_mv[i1, X], self.vertices_mv[i1, Y], self.vertices_mv[i1, Z])
-            p2 = new_point3d(self.vertices_mv[i2, X], self.vertices_mv[i2, Y], self.vertices_mv[i2, Z])
-            p3 = new_point3d(self.vertices_mv[i3, X], self.vertices_mv[i3, Y], self.vertices_mv[i3, Z])
+            # edge vectors from the first vertex to the second and third vertices,
+            # the arithmetic is performed inline as this loop runs over every
+            # triangle and allocating point/vector objects dominates the cost,
+            # the vertices are promoted to double before subtraction to avoid
+            # losing precision on nearly degenerate triangles
+            e1x = <double> self.vertices_mv[i2, X] - <double> self.vertices_mv[i1, X]
+            e1y = <double> self.vertices_mv[i2, Y] - <double> self.vertices_mv[i1, Y]
+            e1z = <double> self.vertices_mv[i2, Z] - <double> self.vertices_mv[i1, Z]
 
-            v1 = p1.vector_to(p2)
-            v2 = p1.vector_to(p3)
-            v3 = v1.cross(v2).normalise()
+            e2x = <double> self.vertices_mv[i3, X] - <double> self.vertices_mv[i1, X]
+            e2y = <double> self.vertices_mv[i3, Y] - <double> self.vertices_mv[i1, Y]
+            e2z = <double> self.vertices_mv[i3, Z] - <double> self.vertices_mv[i1, Z]
 
-            self.face_normals_mv[i, X] = v3.x
-            self.face_normals_mv[i, Y] = v3.y
-            self.face_normals_mv[i, Z] = v3.z
+            # face normal is the cross product of the edge vectors, the
+            # cross product of a degenerate triangle's edges is zero
+            nx = e1y * e2z - e2y * e1z
+            ny = e2x * e1z - e1x * e2z
+            nz = e1x * e2y - e2x * e1y
+
+            # test the squared length so the square root is only evaluated
+            # for triangles that are not degenerate
+            t = nx * nx + ny * ny + nz * nz
+            if t == 0.0:
+
+                if tolerant:
+                    # triangle is degenerate, skip
+                    continue
+
+                raise ZeroDivisionError("The face normal of triangle {} can not be calculated as the triangle is degenerate.".format(i))
+
+            # shift triangles
+            if valid != i:
+                self.triangles_mv[valid, :] = self.triangles_mv[i, :]
+
+            # normalise
+            t = 1.0 / sqrt(t)
+            self.face_normals_mv[valid, X] = nx * t
+            self.face_normals_mv[valid, Y] = ny * t
+            self.face_normals_mv[valid, Z] = nz * t
+
+            valid += 1
+
+        # reslice arrays to contain only valid triangles
+        self._triangles = self._triangles[:valid, :]
+        self.triangles_mv = self._triangles
+        self._face_normals = self._face_normals[:valid, :]
+        self.face_normals_mv = self._face_normals
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -950,7 +952,7 @@ cdef class MeshData(KDTree3DCore):
         super().load(file)
 
         # generate face normals
-        self._generate_face_normals()
+        self._generate_face_normals(False)
 
         # initial hit data
         self._u = -1.0
@@ -30,12 +30,16 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from raysect.primitive.mesh import Mesh
+from numpy import arange, dtype, float64, frombuffer, zeros
 import struct
 
 STL_AUTOMATIC = 'auto'
 STL_ASCII = 'ascii'
 STL_BINARY = 'binary'
 
+# binary STL triangle record: face normal, three vertices and an attribute byte count
+_BINARY_TRIANGLE = dtype([('normal', '<f4', (3, )), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+
 
 class STLHandler:
 
@@ -147,58 +151,28 @@ class STLHandler:
     @classmethod
     def _load_binary(cls, filename, scaling):
 
-        # amount of bytes to read while using buffered reading
-        BUFFER_SIZE = 4096
-
         # the amount of bytes in the header field
         HEADER_SIZE = 80
 
         # the amount of bytes in the count field
         COUNT_SIZE = 4
 
-        triangles = []
-
         with open(filename, 'rb') as f:
 
             header = f.read(HEADER_SIZE).lower()
             count, = struct.unpack('@i', f.read(COUNT_SIZE))
 
-            # if check_size:
-            #     # Check the size of the file
-            #     f.seek(0, os.SEEK_END)
-            #     raw_size = f.tell() - HEADER_SIZE - COUNT_SIZE
-            #     expected_count = raw_size / cls.dtype.itemsize
-            #     if expected_count != count:
-            #         raise ValueError('Expected {} vectors but header indicates {}. '
-            #                          'Is file invalid?'.format(expected_count, count))
-            #     #
-            #     f.seek(HEADER_SIZE + COUNT_SIZE)
-
-            vertices = []
-            triangles = []
+            # the triangle records are read in bulk rather than unpacked one at a time
+            buffer = f.read(count * _BINARY_TRIANGLE.itemsize)
+            if len(buffer) != count * _BINARY_TRIANGLE.itemsize:
+                raise ValueError('The binary STL file is truncated, the header specifies {} triangles.'.format(count))
+            records = frombuffer(buffer, dtype=_BINARY_TRIANGLE)
 
-            # Read the rest of the binary data
-            while count > 0:
+        # stored normal is not used, recalculated by Mesh
+        vertices = scaling * records['vertices'].astype(float64).reshape(3 * count, 3)
+        triangles = arange(3 * count).reshape(count, 3)
 
-                # stored normal is not used, recalculated by Mesh
-                nx, ny, nz, = struct.unpack('<3f', f.read(12))
-
-                # triangle vertices
-                v1x, v1y, v1z, = struct.unpack('<3f', f.read(12))
-                v2x, v2y, v2z, = struct.unpack('<3f', f.read(12))
-                v3x, v3y, v3z, = struct.unpack('<3f', f.read(12))
-
-                # unused attribute
-                attrib = struct.unpack('<H', f.read(2))
-
-                # store
-                vertices.append([scaling * v1x, scaling * v1y, scaling * v1z])
-                vertices.append([scaling * v2x, scaling * v2y, scaling * v2z])
-                vertices.append([scaling * v3x, scaling * v3y, scaling * v3z])
-                triangles.append([len(vertices) - 3, len(vertices) - 2, len(vertices) - 1])
-                count -= 1
-
-            return vertices, triangles
+        return vertices, triangles
 
     @classmethod
     def export_stl(cls, mesh, filename, mode=STL_BINARY):
@@ -268,27 +242,16 @@ class STLHandler:
         mesh_name = mesh.name or 'RaysectMesh'
         mesh_name = mesh_name.replace(" ", "_")
 
+        # assemble the triangle records in bulk rather than packing them one value at a time
+        records = zeros(num_triangles, dtype=_BINARY_TRIANGLE)
+        records['normal'] = normals
+        records['vertices'] = vertices[triangles[:, 0:3]]
+
         with open(filename, 'wb') as f:
 
             f.write(struct.pack('80s', mesh_name.encode('utf-8')))
             f.write(struct.pack('<I', num_triangles))
-
-            for i in range(num_triangles):
-
-                # write the face normal coordinates
-                f.write(struct.pack('<f', normals[i, 0]))
-                f.write(struct.pack('<f', normals[i, 1]))
-                f.write(struct.pack('<f', normals[i, 2]))
-
-                # write the three vertex coordinates
-                v1, v2, v3 = triangles[i, 0:3]
-                for vj in (v1, v2, v3):
-                    f.write(struct.pack('<f', vertices[vj, 0]))
-                    f.write(struct.pack('<f', vertices[vj, 1]))
-                    f.write(struct.pack('<f', vertices[vj, 2]))
-
-                # UINT16 – Attribute byte count
-                f.write(struct.pack('<H', 0))
+            f.write(records.tobytes())
 
 
 import_stl = STLHandler.import_stl
@@ -0,0 +1,76 @@
+# Copyright (c) 2014-2018, Dr Alex Meakins, Raysect Project
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     1. Redistributions of source code must retain the above copyright notice,
+#        this list of conditions and the following disclaimer.
+#
+#     2. Redistributions in binary form must reproduce the above copyright
+#        notice, this list of conditions and the following disclaimer in the
+#        documentation and/or other materials provided with the distribution.
+#
+#     3. Neither the name of the Raysect Project nor the names of its
+#        contributors may be used to endorse or promote products derived from
+#        this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import unittest
+from raysect.primitive.mesh.mesh import MeshData
+
+
+class TestMeshData(unittest.TestCase):
+
+    # a unit square split into two triangles with a degenerate (zero area)
+    # triangle between them, the degenerate triangle reuses a vertex
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    triangles = [[0, 1, 2], [0, 2, 2], [0, 2, 3]]
+
+    def test_degenerate_tolerant(self):
+        """Degenerate triangles are removed from the triangle and face normal arrays."""
+
+        mesh = MeshData(self.vertices, self.triangles, tolerant=True)
+
+        self.assertEqual(mesh.triangles.shape, (2, 3), "Degenerate triangle was not removed.")
+        self.assertEqual(mesh.face_normals.shape, (2, 3), "Incorrect number of face normals.")
+        self.assertEqual(mesh.triangles.tolist(), [[0, 1, 2], [0, 2, 3]], "Valid triangles were not preserved in order.")
+        self.assertEqual(mesh.face_normals.tolist(), [[0, 0, 1], [0, 0, 1]], "Incorrect face normals.")
+
+    def test_degenerate_intolerant(self):
+        """Degenerate triangles raise an exception if the mesh is not tolerant."""
+
+        with self.assertRaises(ZeroDivisionError, msg="Degenerate triangle did not raise an exception."):
+            MeshData(self.vertices, self.triangles, tolerant=False)
+
+    def test_face_normals_nearly_degenerate(self):
+        """A nearly degenerate triangle must not be treated as degenerate."""
+
+        # the edge cross product is only ~1e-9, it evaluates to zero if the
+        # vertex differences are calculated in single precision
+        vertices = [[1e-9, 0, 0], [1, 1, 0], [2, 2, 0]]
+        triangles = [[0, 1, 2]]
+
+        mesh = MeshData(vertices, triangles, tolerant=False)
+        self.assertEqual(mesh.triangles.shape, (1, 3), "Nearly degenerate triangle was removed.")
+        self.assertEqual(mesh.face_normals.shape, (1, 3), "Incorrect number of face normals.")
+        self.assertAlmostEqual(mesh.face_normals[0, 2], -1.0, places=6, msg="Incorrect face normal.")
+
+        mesh = MeshData(vertices, triangles, tolerant=True)
+        self.assertEqual(mesh.triangles.shape, (1, 3), "Nearly degenerate triangle was removed.")
+
+
+if __name__ == "__main__":
+    unittest.main()
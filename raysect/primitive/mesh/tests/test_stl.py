@@ -0,0 +1,78 @@
+# Copyright (c) 2014-2018, Dr Alex Meakins, Raysect Project
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     1. Redistributions of source code must retain the above copyright notice,
+#        this list of conditions and the following disclaimer.
+#
+#     2. Redistributions in binary form must reproduce the above copyright
+#        notice, this list of conditions and the following disclaimer in the
+#        documentation and/or other materials provided with the distribution.
+#
+#     3. Neither the name of the Raysect Project nor the names of its
+#        contributors may be used to endorse or promote products derived from
+#        this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from numpy import array, float32
+from raysect.primitive.mesh import Mesh, import_stl, export_stl
+
+
+class TestSTL(unittest.TestCase):
+
+    # a closed tetrahedron
+    vertices = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    triangles = [[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]]
+
+    def test_binary_round_trip(self):
+        """A mesh exported to a binary STL file is imported with the same vertices."""
+
+        mesh = Mesh(self.vertices, self.triangles)
+
+        with TemporaryDirectory() as path:
+            filename = os.path.join(path, 'mesh.stl')
+            export_stl(mesh, filename, mode='binary')
+            imported = import_stl(filename, mode='binary')
+
+        # STL stores unindexed triangles, each triangle has its own vertices
+        expected = array(self.vertices, dtype=float32)[array(self.triangles)].reshape(-1, 3)
+        self.assertEqual(imported.data.vertices.tolist(), expected.tolist(), "Imported vertices do not match the exported mesh.")
+        self.assertEqual(imported.data.triangles.tolist(), [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11]], "Incorrect imported triangles.")
+        self.assertEqual(imported.data.face_normals.tolist(), mesh.data.face_normals.tolist(), "Imported face normals do not match the exported mesh.")
+
+    def test_binary_truncated(self):
+        """A binary STL file with missing triangle records raises an exception."""
+
+        mesh = Mesh(self.vertices, self.triangles)
+
+        with TemporaryDirectory() as path:
+            filename = os.path.join(path, 'mesh.stl')
+            export_stl(mesh, filename, mode='binary')
+
+            # remove the last byte of the final triangle record
+            with open(filename, 'rb+') as f:
+                f.truncate(os.path.getsize(filename) - 1)
+
+            with self.assertRaises(ValueError, msg="Truncated STL file did not raise an exception."):
+                import_stl(filename, mode='binary')
+
+
+if __name__ == "__main__":
+    unittest.main()